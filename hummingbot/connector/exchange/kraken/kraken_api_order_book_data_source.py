@@ -1,5 +1,6 @@
 import asyncio
 import time
+from itertools import chain
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.kraken import kraken_constants as CONSTANTS, kraken_web_utils as web_utils
@@ -85,7 +86,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                           f"Error is {response_json['error']}.")
         data: Dict[str, Any] = next(iter(response_json["result"].values()))
         data = {"trading_pair": trading_pair, **data}
-        data["latest_update"] = max([*map(lambda x: x[2], data["bids"] + data["asks"])], default=0.)
+        data["latest_update"] = max((entry[2] for entry in chain(data["bids"], data["asks"])), default=0.)
         return data
 
     async def _subscribe_channels(self, ws: WSAssistant):
@@ -95,11 +96,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            trading_pairs: List[str] = []
-            for tp in self._trading_pairs:
-                # trading_pairs.append(convert_to_exchange_trading_pair(tp, '/'))
-                symbol = convert_to_exchange_trading_pair(tp, '/')
-                trading_pairs.append(symbol)
+            trading_pairs: List[str] = [convert_to_exchange_trading_pair(tp, '/') for tp in self._trading_pairs]
             trades_payload = {
                 "event": "subscribe",
                 "pair": trading_pairs,
@@ -142,13 +139,10 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return ws
 
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-
-        trades = [
-            {"pair": convert_from_exchange_trading_pair(raw_message[-1]), "trade": trade}
-            for trade in raw_message[1]
-        ]
-        for trade in trades:
-            trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(trade)
+        trading_pair = convert_from_exchange_trading_pair(raw_message[-1])
+        for trade in raw_message[1]:
+            trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(
+                {"pair": trading_pair, "trade": trade})
             message_queue.put_nowait(trade_msg)
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
@@ -156,13 +150,14 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     "asks": raw_message[1].get("a", []) or raw_message[1].get("as", []) or [],
                     "bids": raw_message[1].get("b", []) or raw_message[1].get("bs", []) or []}
         msg_dict["update_id"] = max(
-            [*map(lambda x: float(x[2]), msg_dict["bids"] + msg_dict["asks"])], default=0.
+            (float(entry[2]) for entry in chain(msg_dict["bids"], msg_dict["asks"])), default=0.
         )
+        timestamp: float = time.time()
         if "as" in raw_message[1] and "bs" in raw_message[1]:
             order_book_message: OrderBookMessage = (
-                KrakenOrderBook.snapshot_ws_message_from_exchange(msg_dict, time.time())
+                KrakenOrderBook.snapshot_ws_message_from_exchange(msg_dict, timestamp)
             )
         else:
             order_book_message: OrderBookMessage = KrakenOrderBook.diff_message_from_exchange(
-                msg_dict, time.time())
+                msg_dict, timestamp)
         message_queue.put_nowait(order_book_message)
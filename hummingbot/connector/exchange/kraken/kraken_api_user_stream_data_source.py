@@ -84,10 +84,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
             raise
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
-        if type(event_message) is list and event_message[-2] in [
-            CONSTANTS.USER_TRADES_ENDPOINT_NAME,
-            CONSTANTS.USER_ORDERS_ENDPOINT_NAME,
-        ]:
+        if type(event_message) is list and event_message[-2] in CONSTANTS.USER_STREAM_ENDPOINT_NAMES:
             queue.put_nowait(event_message)
         else:
             if event_message.get("errorMessage") is not None:
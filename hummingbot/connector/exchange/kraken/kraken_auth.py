@@ -1,16 +1,23 @@
 import base64
+import binascii
 import hashlib
 import hmac
 import json
 import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
 
+@lru_cache(maxsize=64)
+def _url_path(url: str) -> str:
+    return urlsplit(url).path
+
+
 class KrakenAuth(AuthBase):
     _last_tracking_nonce: int = 0
 
@@ -18,17 +25,18 @@ class KrakenAuth(AuthBase):
         self.api_key = api_key
         self.secret_key = secret_key
         self.time_provider = time_provider
+        # Keyed HMAC prototype, built on the first signature so an invalid secret only fails when signing
+        self._hmac_template: Optional[hmac.HMAC] = None
 
     @classmethod
-    def get_tracking_nonce(self) -> str:
-        nonce = int(time.time())
-        self._last_tracking_nonce = nonce if nonce > self._last_tracking_nonce else self._last_tracking_nonce + 1
-        return str(self._last_tracking_nonce)
+    def get_tracking_nonce(cls) -> str:
+        cls._last_tracking_nonce = max(int(time.time()), cls._last_tracking_nonce + 1)
+        return str(cls._last_tracking_nonce)
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
 
         data = json.loads(request.data) if request.data is not None else {}
-        _path = urlparse(request.url).path
+        _path = _url_path(request.url)
 
         auth_dict: Dict[str, Any] = self._generate_auth_dict(_path, data)
         request.headers = auth_dict["headers"]
@@ -48,29 +56,29 @@ class KrakenAuth(AuthBase):
         :return: a dictionary of request info including the request signature and post data
         """
 
-        # Decode API private key from base64 format displayed in account management
-        api_secret: bytes = base64.b64decode(self.secret_key)
-
         # Variables (API method, nonce, and POST data)
-        api_path: bytes = bytes(uri, 'utf-8')
+        api_path: bytes = uri.encode()
         api_nonce: str = self.get_tracking_nonce()
         api_post: str = "nonce=" + api_nonce
 
-        if data is not None:
-            for key, value in data.items():
-                api_post += f"&{key}={value}"
+        if data:
+            api_post += "".join(f"&{key}={value}" for key, value in data.items())
 
         # Cryptographic hash algorithms
-        api_sha256: bytes = hashlib.sha256(bytes(api_nonce + api_post, 'utf-8')).digest()
-        api_hmac: hmac.HMAC = hmac.new(api_secret, api_path + api_sha256, hashlib.sha512)
+        api_sha256: bytes = hashlib.sha256((api_nonce + api_post).encode()).digest()
+        if self._hmac_template is None:
+            # Decode API private key from base64 format displayed in account management
+            self._hmac_template = hmac.new(base64.b64decode(self.secret_key), digestmod=hashlib.sha512)
+        api_hmac: hmac.HMAC = self._hmac_template.copy()
+        api_hmac.update(api_path + api_sha256)
 
         # Encode signature into base64 format used in API-Sign value
-        api_signature: bytes = base64.b64encode(api_hmac.digest())
+        api_signature: str = binascii.b2a_base64(api_hmac.digest(), newline=False).decode()
 
         return {
             "headers": {
                 "API-Key": self.api_key,
-                "API-Sign": str(api_signature, 'utf-8')
+                "API-Sign": api_signature
             },
             "post": api_post,
             "postDict": {"nonce": api_nonce, **data} if data is not None else {"nonce": api_nonce}
@@ -41,6 +41,7 @@ KRAKEN_TO_HB_MAP = {
     "XBT": "BTC",
     "XDG": "DOGE",
 }
+HB_TO_KRAKEN_MAP = {v: k for k, v in KRAKEN_TO_HB_MAP.items()}
 
 BASE_URL = "https://api.kraken.com"
 TICKER_PATH_URL = "/0/public/Ticker"
@@ -57,6 +58,7 @@ QUERY_TRADES_PATH_URL = "/0/private/QueryTrades"
 
 
 UNKNOWN_ORDER_MESSAGE = "Unknown order"
+ORDER_NOT_FOUND_ERRORS = ("EOrder:Unknown order", "EOrder:Invalid order")
 # Order States
 ORDER_STATE = {
     "pending": OrderState.OPEN,
@@ -75,6 +77,7 @@ TRADE_EVENT_TYPE = "trade"
 PING_TIMEOUT = 10
 USER_TRADES_ENDPOINT_NAME = "ownTrades"
 USER_ORDERS_ENDPOINT_NAME = "openOrders"
+USER_STREAM_ENDPOINT_NAMES = frozenset({USER_TRADES_ENDPOINT_NAME, USER_ORDERS_ENDPOINT_NAME})
 
 PUBLIC_ENDPOINT_LIMIT_ID = "PublicEndpointLimitID"
 PUBLIC_ENDPOINT_LIMIT = 1
@@ -298,11 +298,10 @@ class KrakenExchange(ExchangePyBase):
             "ordertype": "market" if order_type is OrderType.MARKET else "limit",
             "volume": str(amount),
             "userref": order_id,
-            "price": str(price)
         }
 
-        if order_type is OrderType.MARKET:
-            del data["price"]
+        if order_type is not OrderType.MARKET:
+            data["price"] = str(price)
         if order_type is OrderType.LIMIT_MAKER:
             data["oflags"] = "post"
         order_result = await self._api_request_with_retry(RESTMethod.POST,
@@ -327,12 +326,13 @@ class KrakenExchange(ExchangePyBase):
                 response_json = await self._api_request(path_url=path_url, method=method, params=params, data=data,
                                                         is_auth_required=is_auth_required)
 
-                if response_json.get("error") and "EAPI:Invalid nonce" in response_json.get("error", ""):
+                error = response_json.get("error")
+                if error and "EAPI:Invalid nonce" in error:
                     self.logger().error(f"Invalid nonce error from {path_url}. " +
                                         "Please ensure your Kraken API key nonce window is at least 10, " +
                                         "and if needed reset your API key.")
                 result = response_json.get("result")
-                if not result or response_json.get("error"):
+                if not result or error:
                     raise IOError({"error": response_json})
                 break
             except IOError as e:
@@ -365,11 +365,7 @@ class KrakenExchange(ExchangePyBase):
             path_url=CONSTANTS.CANCEL_ORDER_PATH_URL,
             data=api_params,
             is_auth_required=True)
-        if isinstance(cancel_result, dict) and (
-                cancel_result.get("count") == 1 or
-                cancel_result.get("error") is not None):
-            return True
-        return False
+        return cancel_result.get("count") == 1 or cancel_result.get("error") is not None
 
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
@@ -423,8 +419,8 @@ class KrakenExchange(ExchangePyBase):
             try:
                 trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=rule.get("altname"))
                 min_order_size = Decimal(rule.get('ordermin', 0))
-                min_price_increment = Decimal(f"1e-{rule.get('pair_decimals')}")
-                min_base_amount_increment = Decimal(f"1e-{rule.get('lot_decimals')}")
+                min_price_increment = Decimal((0, (1,), -rule.get('pair_decimals')))
+                min_base_amount_increment = Decimal((0, (1,), -rule.get('lot_decimals')))
                 retval.append(
                     TradingRule(
                         trading_pair,
@@ -473,6 +469,8 @@ class KrakenExchange(ExchangePyBase):
             order_fill: Dict[str, Any],
             order: InFlightOrder):
         fee_asset = order.quote_asset
+        fill_base_amount = Decimal(order_fill["vol"])
+        fill_price = Decimal(order_fill["price"])
 
         fee = TradeFeeBase.new_spot_fee(
             fee_schema=self.trade_fee_schema(),
@@ -489,29 +487,30 @@ class KrakenExchange(ExchangePyBase):
             exchange_order_id=order_fill.get("ordertxid"),
             trading_pair=order.trading_pair,
             fee=fee,
-            fill_base_amount=Decimal(order_fill["vol"]),
-            fill_quote_amount=Decimal(order_fill["vol"]) * Decimal(order_fill["price"]),
-            fill_price=Decimal(order_fill["price"]),
+            fill_base_amount=fill_base_amount,
+            fill_quote_amount=fill_base_amount * fill_price,
+            fill_price=fill_price,
             fill_timestamp=order_fill["time"],
         )
         return trade_update
 
     def _process_trade_message(self, trades: List):
+        fillable_orders = self._order_tracker.all_fillable_orders
         for update in trades:
-            trade_id: str = next(iter(update))
-            trade: Dict[str, str] = update[trade_id]
-            trade["trade_id"] = trade_id
-            exchange_order_id = trade.get("ordertxid")
-            client_order_id = str(trade.get("userref", ""))
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-
-            if not tracked_order:
-                self.logger().debug(f"Ignoring trade message with id {exchange_order_id}: not in in_flight_orders.")
-            else:
-                trade_update = self._create_trade_update_with_order_fill_data(
-                    order_fill=trade,
-                    order=tracked_order)
-                self._order_tracker.process_trade_update(trade_update)
+            for trade_id, trade in update.items():
+                trade["trade_id"] = trade_id
+                exchange_order_id = trade.get("ordertxid")
+                client_order_id = str(trade.get("userref", ""))
+                tracked_order = fillable_orders.get(client_order_id)
+
+                if not tracked_order:
+                    self.logger().debug("Ignoring trade message with id %s: not in in_flight_orders.",
+                                        exchange_order_id)
+                else:
+                    trade_update = self._create_trade_update_with_order_fill_data(
+                        order_fill=trade,
+                        order=tracked_order)
+                    self._order_tracker.process_trade_update(trade_update)
 
     def _create_order_update_with_order_status_data(self, order_status: Dict[str, Any], order: InFlightOrder):
         order_update = OrderUpdate(
@@ -530,9 +529,8 @@ class KrakenExchange(ExchangePyBase):
                 client_order_id = str(order_msg.get("userref", ""))
                 tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
                 if not tracked_order:
-                    self.logger().debug(
-                        f"Ignoring order message with id {order_msg}: not in in_flight_orders.")
-                    return
+                    self.logger().debug("Ignoring order message with id %s: not in in_flight_orders.", order_msg)
+                    continue
                 if "status" in order_msg:
                     order_update = self._create_order_update_with_order_status_data(order_status=order_msg,
                                                                                     order=tracked_order)
@@ -549,19 +547,16 @@ class KrakenExchange(ExchangePyBase):
                 data={"txid": exchange_order_id},
                 is_auth_required=True)
 
-            for trade_id, trade_fill in all_fills_response.items():
-                trade: Dict[str, str] = all_fills_response[trade_id]
+            for trade_id, trade in all_fills_response.items():
                 trade["trade_id"] = trade_id
-                trade_update = self._create_trade_update_with_order_fill_data(
-                    order_fill=trade,
-                    order=order)
-                trade_updates.append(trade_update)
+                trade_updates.append(self._create_trade_update_with_order_fill_data(order_fill=trade, order=order))
 
         except asyncio.TimeoutError:
             raise IOError(f"Skipped order update with order fills for {order.client_order_id} "
                           "- waiting for exchange order id.")
         except Exception as e:
-            if "EOrder:Unknown order" in str(e) or "EOrder:Invalid order" in str(e):
+            error_description = str(e)
+            if any(error in error_description for error in CONSTANTS.ORDER_NOT_FOUND_ERRORS):
                 return trade_updates
         return trade_updates
 
@@ -595,14 +590,15 @@ class KrakenExchange(ExchangePyBase):
                                                          is_auth_required=True)
 
         locked = defaultdict(Decimal)
+        available_trading_pairs: Optional[Tuple[str, ...]] = None
 
         for order in open_orders.get("open").values():
             if order.get("status") == "open":
                 details = order.get("descr")
                 if details.get("ordertype") == "limit":
-                    pair = convert_from_exchange_trading_pair(
-                        details.get("pair"), tuple((await self.get_asset_pairs()).keys())
-                    )
+                    if available_trading_pairs is None:
+                        available_trading_pairs = tuple((await self.get_asset_pairs()).keys())
+                    pair = convert_from_exchange_trading_pair(details.get("pair"), available_trading_pairs)
                     (base, quote) = self.split_trading_pair(pair)
                     vol_locked = Decimal(order.get("vol", 0)) - Decimal(order.get("vol_exec", 0))
                     if details.get("type") == "sell":
@@ -610,29 +606,32 @@ class KrakenExchange(ExchangePyBase):
                     elif details.get("type") == "buy":
                         locked[convert_from_exchange_symbol(quote)] += vol_locked * Decimal(details.get("price"))
 
+        earn_asset_names: List[str] = []
         for asset_name, balance in balances.items():
             cleaned_name = convert_from_exchange_symbol(asset_name).upper()
             total_balance = Decimal(balance)
-            free_balance = total_balance - Decimal(locked[cleaned_name])
+            free_balance = total_balance - locked[cleaned_name]
             self._account_available_balances[cleaned_name] = free_balance
             self._account_balances[cleaned_name] = total_balance
             remote_asset_names.add(cleaned_name)
-
-        for cleaned_name, ava_balance in self._account_available_balances.items():
-            if cleaned_name.endswith(".F"):
-                asset_normal_name = cleaned_name.split(".")[0]
-                cleaned_normal_name = convert_from_exchange_symbol(asset_normal_name).upper()
-                new_total_amount = self._account_available_balances.get(cleaned_normal_name, 0) + ava_balance
-                self._account_available_balances.update({cleaned_normal_name: new_total_amount})
-                self._account_available_balances.update({cleaned_name: 0})
-
-        for cleaned_name, total_balance in self._account_balances.items():
             if cleaned_name.endswith(".F"):
-                asset_normal_name = cleaned_name.split(".")[0]
-                cleaned_normal_name = convert_from_exchange_symbol(asset_normal_name).upper()
-                new_total_amount = self._account_balances.get(cleaned_normal_name, 0) + total_balance
-                self._account_balances.update({cleaned_normal_name: new_total_amount})
-                self._account_balances.update({cleaned_name: 0})
+                earn_asset_names.append(cleaned_name)
+
+        # Fold Kraken Earn (".F") balances into their base asset in a single pass
+        for cleaned_name in earn_asset_names:
+            cleaned_normal_name = convert_from_exchange_symbol(cleaned_name.split(".")[0]).upper()
+            if cleaned_normal_name not in remote_asset_names:
+                # Earn-only asset: drop the value folded in by the previous poll
+                self._account_available_balances[cleaned_normal_name] = Decimal("0")
+                self._account_balances[cleaned_normal_name] = Decimal("0")
+                remote_asset_names.add(cleaned_normal_name)
+            self._account_available_balances[cleaned_normal_name] = (
+                self._account_available_balances[cleaned_normal_name]
+                + self._account_available_balances[cleaned_name])
+            self._account_balances[cleaned_normal_name] = (
+                self._account_balances[cleaned_normal_name] + self._account_balances[cleaned_name])
+            self._account_available_balances[cleaned_name] = 0
+            self._account_balances[cleaned_name] = 0
 
         asset_names_to_remove = local_asset_names.difference(remote_asset_names)
         for asset_name in asset_names_to_remove:
@@ -640,9 +639,10 @@ class KrakenExchange(ExchangePyBase):
             del self._account_balances[asset_name]
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
-        mapping = bidict()
-        for symbol_data in filter(web_utils.is_exchange_information_valid, exchange_info.values()):
-            mapping[symbol_data["altname"]] = convert_from_exchange_trading_pair(symbol_data["wsname"])
+        mapping = bidict({
+            symbol_data["altname"]: convert_from_exchange_trading_pair(symbol_data["wsname"])
+            for symbol_data in filter(web_utils.is_exchange_information_valid, exchange_info.values())
+        })
         self._set_trading_pair_symbol_map(mapping)
 
     async def _get_last_traded_price(self, trading_pair: str) -> float:
@@ -654,5 +654,5 @@ class KrakenExchange(ExchangePyBase):
             path_url=CONSTANTS.TICKER_PATH_URL,
             params=params
         )
-        record = list(resp_json.values())[0]
+        record = next(iter(resp_json.values()))
         return float(record["c"][0])
@@ -28,8 +28,7 @@ def convert_from_exchange_symbol(symbol: str) -> str:
 
 
 def convert_to_exchange_symbol(symbol: str) -> str:
-    inverted_kraken_to_hb_map = {v: k for k, v in CONSTANTS.KRAKEN_TO_HB_MAP.items()}
-    return inverted_kraken_to_hb_map.get(symbol, symbol)
+    return CONSTANTS.HB_TO_KRAKEN_MAP.get(symbol, symbol)
 
 
 def split_to_base_quote(exchange_trading_pair: str) -> Tuple[Optional[str], Optional[str]]:
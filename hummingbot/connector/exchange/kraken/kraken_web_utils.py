@@ -42,9 +42,8 @@ def is_exchange_information_valid(trading_pair_details) -> bool:
     For more info, please check
     https://support.kraken.com/hc/en-us/articles/360001391906-Introducing-the-Kraken-Dark-Pool
     """
-    if trading_pair_details.get('altname'):
-        return not trading_pair_details.get('altname').endswith('.d')
-    return True
+    altname = trading_pair_details.get('altname')
+    return not altname or not altname.endswith('.d')
 
 
 async def get_current_server_time(
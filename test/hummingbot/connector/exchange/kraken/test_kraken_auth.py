@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import binascii
 import hashlib
 import hmac
 import json
@@ -63,3 +64,10 @@ class KrakenAuthTests(TestCase):
         # self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(str(expected_signature, 'utf-8'), configured_request.headers["API-Sign"])
         self.assertEqual(self._api_key, configured_request.headers["API-Key"])
+
+    def test_invalid_secret_only_fails_when_signing(self):
+        auth = KrakenAuth(api_key=self._api_key, secret_key="abc", time_provider=MagicMock())
+        request = RESTRequest(method=RESTMethod.POST, url="/test", is_auth_required=True)
+
+        with self.assertRaises(binascii.Error):
+            self.async_run_with_timeout(auth.rest_authenticate(request))
@@ -1,9 +1,11 @@
+import asyncio
+import binascii
 import json
 import logging
 import re
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -836,6 +838,35 @@ class KrakenExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
 
         self.assertEqual(ret, NetworkStatus.NOT_CONNECTED)
 
+    def test_user_stream_order_update_skips_untracked_orders_in_same_message(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+
+        event_message = self.order_event_for_canceled_order_websocket_update(order=order)
+        untracked_order_update = {"EOID0": {"status": "canceled", "userref": "OID0"}}
+        event_message[0].insert(0, untracked_order_update)
+
+        mock_queue = AsyncMock()
+        mock_queue.get.side_effect = [event_message, asyncio.CancelledError]
+        self.exchange._user_stream_tracker._user_stream = mock_queue
+
+        try:
+            self.async_run_with_timeout(self.exchange._user_stream_event_listener())
+        except asyncio.CancelledError:
+            pass
+
+        self.assertTrue(order.is_cancelled)
+        self.assertNotIn(order.client_order_id, self.exchange.in_flight_orders)
+
     @aioresponses()
     def test_update_order_status_when_failed(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -1068,6 +1099,48 @@ class KrakenExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
         self.assertEqual(self.exchange.available_balances[self.quote_asset], Decimal("171286.6158"))
         self.assertEqual(self.exchange.available_balances[self.base_asset], Decimal("11"))
 
+    def test_exchange_with_invalid_secret_can_be_created(self):
+        exchange = KrakenExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            kraken_api_key=self.api_key,
+            kraken_secret_key="abc",
+            trading_pairs=[self.trading_pair],
+        )
+
+        with self.assertRaises(binascii.Error):
+            exchange.authenticator._generate_auth_dict("/test")
+
+    @aioresponses()
+    def test_update_balances_folds_earn_balances_into_base_asset(self, mocked_api):
+        url = f"{CONSTANTS.BASE_URL}{CONSTANTS.BALANCE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = {
+            "error": [],
+            "result": {
+                self.base_asset: "1",
+                f"{self.base_asset}.F": "2",
+                "DOT.F": "3",
+            }
+        }
+        mocked_api.post(regex_url, body=json.dumps(resp), repeat=True)
+
+        url = f"{CONSTANTS.BASE_URL}{CONSTANTS.OPEN_ORDERS_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mocked_api.post(regex_url, body=json.dumps({"error": [], "result": {"open": {}}}), repeat=True)
+
+        # Poll twice so values folded in by the first poll cannot leak into the second
+        for _ in range(2):
+            self.async_run_with_timeout(self.exchange._update_balances())
+
+            self.assertEqual(Decimal("3"), self.exchange.get_balance(self.base_asset))
+            self.assertEqual(Decimal("3"), self.exchange.available_balances[self.base_asset])
+            self.assertEqual(Decimal("3"), self.exchange.get_balance("DOT"))
+            self.assertEqual(Decimal("3"), self.exchange.available_balances["DOT"])
+        self.assertEqual(Decimal("0"), self.exchange.get_balance(f"{self.base_asset}.F"))
+        self.assertEqual(Decimal("0"), self.exchange.available_balances[f"{self.base_asset}.F"])
+        self.assertEqual(Decimal("0"), self.exchange.get_balance("DOT.F"))
+        self.assertEqual(Decimal("0"), self.exchange.available_balances["DOT.F"])
+
     def _order_cancelation_request_successful_mock_response(self, order: InFlightOrder) -> Any:
         return {
             "error": [],